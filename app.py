@@ -1,13 +1,37 @@
 import os
-import base64
-import json
+import hashlib
 import time
+import threading
+import tempfile
+import shutil
+import subprocess
+from typing import BinaryIO
 from flask import Flask, request, jsonify
-from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import msgspec
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from cachetools import LRUCache
+from diskcache import Cache
+
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
 
 app = Flask(__name__)
-CORS(app)
+# Werkzeug refuses larger bodies before any of the upload is parsed
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
+
+
+# The API is public and cookie-free, so static CORS headers are enough
+@app.after_request
+def add_cors_headers(response):
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    response.headers["Access-Control-Allow-Methods"] = "POST, GET, OPTIONS"
+    response.headers["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 GEMINI_MODEL = "gemini-2.5-flash"
@@ -15,6 +39,53 @@ GEMINI_MODEL = "gemini-2.5-flash"
 if not GEMINI_API_KEY:
     raise RuntimeError("GEMINI_API_KEY environment variable is required")
 
+class NoReadTimeoutRetry(Retry):
+    """
+    Retry that never re-sends a request whose response timed out: a stalled
+    call would be billed again while the thread waits out another read
+    timeout. Resets on reused keep-alive sockets still retry under total.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        if isinstance(error, ReadTimeoutError):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+# Exponential backoff with jitter for overload, transient server errors and
+# dropped connections
+GEMINI_RETRY = NoReadTimeoutRetry(
+    total=4,
+    backoff_factor=0.8,
+    backoff_jitter=0.5,
+    backoff_max=8,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# Shared session keeps TLS connections to Gemini alive between requests
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=GEMINI_RETRY),
+)
+SESSION.headers["Connection"] = "keep-alive"
+SESSION.headers["x-goog-api-key"] = GEMINI_API_KEY
+
+# Best-effort side calls that must fail fast rather than back off
+NO_RETRY_SESSION = requests.Session()
+NO_RETRY_SESSION.mount("https://", HTTPAdapter(max_retries=0))
+NO_RETRY_SESSION.headers["x-goog-api-key"] = GEMINI_API_KEY
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# (connect, read) seconds; read bounds each wait for bytes, so a stalled
+# response cannot hold a worker thread for minutes
+TIMEOUT = (5, 120)
+
 EVAL_PROMPT = """
 You receive a 30 second video of a person delivering a short pitch.
 Your role is to act as a strict yet fair evaluation committee made of top industry experts whose goal is to push average pitches toward excellence.
@@ -126,80 +197,492 @@ Return JSON in this format only:
 """
 
 
-def call_gemini_with_video(video_bytes: bytes, mime_type: str) -> dict:
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com"
+MODEL_URL = f"{GEMINI_API_BASE}/v1beta/models/{GEMINI_MODEL}"
+UPLOAD_URL = f"{GEMINI_API_BASE}/upload/v1beta/files"
+CACHED_CONTENTS_URL = f"{GEMINI_API_BASE}/v1beta/cachedContents"
+GENERATE_URL = (
+    f"{GEMINI_API_BASE}/v1beta/models/{GEMINI_MODEL}:streamGenerateContent?alt=sse"
+)
+FILE_POLL_INTERVAL = 2
+FILE_POLL_ATTEMPTS = 60
+PROMPT_CACHE_TTL = 3600
+PROMPT_CACHE_RETRY = 600
+PROMPT_CACHE_TIMEOUT = (5, 15)
+DELETE_TIMEOUT = (5, 10)
+HASH_CHUNK_SIZE = 1024 * 1024
+EVAL_CACHE_TTL = 7 * 86400
+
+# Downscale uploads before they go to Gemini; TRANSCODE_VIDEO=0 turns it off
+FFMPEG = shutil.which("ffmpeg") if os.environ.get("TRANSCODE_VIDEO", "1") != "0" else None
+FFPROBE = shutil.which("ffprobe") if FFMPEG else None
+TRANSCODE_TIMEOUT = 120
+TRANSCODE_MAX_HEIGHT = 720
+# ffmpeg is CPU heavy; bound how many run at once in each worker
+TRANSCODE_SLOTS = threading.BoundedSemaphore(
+    int(os.environ.get("TRANSCODE_CONCURRENCY", 2))
+)
+
+# Recent results keyed by video hash, so duplicate uploads skip Gemini
+EVAL_CACHE = LRUCache(maxsize=512)
+_eval_cache_lock = threading.Lock()
+
+# Disk layer survives restarts and is shared by all workers on the host
+DISK_CACHE = Cache(
+    os.environ.get("CACHE_DIR", os.path.join(tempfile.gettempdir(), "pitchmi")),
+    size_limit=2**30,
+)
+
+
+class EvalResult(msgspec.Struct):
     """
-    Send inline video to Gemini generateContent and expect JSON text back.
-    No file handles are created and nothing is stored to disk.
+    Schema of the JSON object EVAL_PROMPT asks Gemini to return.
     """
-    url = (
-        f"https://generativelanguage.googleapis.com/v1beta/models/"
-        f"{GEMINI_MODEL}:generateContent?key={GEMINI_API_KEY}"
-    )
+    structure_score: int
+    presentation_score: int
+    clarity_score: int
+    weighted_total: int
+    comments: list[str]
+
+
+_prompt_cache = {"name": None, "expires": 0.0, "refreshing": False}
+_prompt_cache_lock = threading.Lock()
+
+# Built once and shared by every payload; treat as read-only
+PROMPT_PART = {"text": EVAL_PROMPT}
+_GEN_CFG = {
+    "temperature": 0.2,
+    "responseMimeType": "application/json",
+    # Scoring against a fixed rubric needs no extended reasoning
+    "thinkingConfig": {"thinkingBudget": 0},
+}
+
+# Cache keys change whenever the prompt, model or generation config does
+PROMPT_VERSION = hashlib.blake2b(
+    f"{GEMINI_MODEL}\n{EVAL_PROMPT}".encode("utf-8") + orjson.dumps(_GEN_CFG),
+    digest_size=8,
+).hexdigest()
 
-    b64_data = base64.b64encode(video_bytes).decode("ascii")
-
-    payload = {
-        "contents": [
-            {
-                "role": "user",
-                "parts": [
-                    {"text": EVAL_PROMPT},
-                    {
-                        "inline_data": {
-                            "mime_type": mime_type,
-                            "data": b64_data,
-                        }
-                    },
-                ],
-            }
-        ],
-        "generationConfig": {
-            "temperature": 0.2,
-            "responseMimeType": "application/json"
+
+def upload_video_to_gemini(video_stream: BinaryIO, size: int, mime_type: str) -> dict:
+    """
+    Stream raw video bytes through the Gemini Files API resumable protocol.
+    Returns the new file resource, which may still be processing.
+    """
+    start = SESSION.post(
+        UPLOAD_URL,
+        headers={
+            "X-Goog-Upload-Protocol": "resumable",
+            "X-Goog-Upload-Command": "start",
+            "X-Goog-Upload-Header-Content-Length": str(size),
+            "X-Goog-Upload-Header-Content-Type": mime_type,
+            **JSON_HEADERS,
         },
+        data=orjson.dumps({"file": {"display_name": "pitch"}}),
+        timeout=TIMEOUT,
+    )
+    upload_url = start.headers.get("X-Goog-Upload-URL")
+    if start.status_code != 200 or not upload_url:
+        raise RuntimeError(
+            f"Gemini upload start error {start.status_code}: {start.text[:300]}"
+        )
+
+    resp = SESSION.post(
+        upload_url,
+        headers={
+            "Content-Length": str(size),
+            "X-Goog-Upload-Offset": "0",
+            "X-Goog-Upload-Command": "upload, finalize",
+        },
+        # A file object is sent in small blocks, never loaded whole into memory
+        data=video_stream,
+        timeout=TIMEOUT,
+    )
+    if resp.status_code != 200:
+        raise RuntimeError(
+            f"Gemini upload error {resp.status_code}: {resp.text[:300]}"
+        )
+
+    try:
+        file_info = orjson.loads(resp.content)["file"]
+    except Exception as e:
+        raise RuntimeError(f"Unexpected Gemini upload response: {str(e)}")
+
+    return file_info
+
+
+def wait_for_file_active(file_info: dict) -> dict:
+    """
+    Poll an uploaded file until Gemini has finished processing it.
+    Videos must be ACTIVE before generateContent can reference them.
+    """
+    for _ in range(FILE_POLL_ATTEMPTS):
+        state = file_info.get("state")
+        if state == "ACTIVE":
+            return file_info
+        if state == "FAILED":
+            raise RuntimeError("Gemini failed to process the uploaded video")
+
+        time.sleep(FILE_POLL_INTERVAL)
+        resp = SESSION.get(
+            f"{GEMINI_API_BASE}/v1beta/{file_info['name']}", timeout=TIMEOUT
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Gemini file status error {resp.status_code}: {resp.text[:300]}"
+            )
+        try:
+            file_info = orjson.loads(resp.content)
+        except orjson.JSONDecodeError as e:
+            raise RuntimeError(f"Unexpected Gemini file status response: {str(e)}")
+
+    raise RuntimeError("Gemini video processing timed out")
+
+
+def delete_gemini_file(name: str) -> None:
+    """
+    Remove an uploaded file so nothing outlives the request on Gemini's side.
+    """
+    try:
+        NO_RETRY_SESSION.delete(
+            f"{GEMINI_API_BASE}/v1beta/{name}", timeout=DELETE_TIMEOUT
+        )
+    except requests.exceptions.RequestException:
+        pass
+
+
+def get_prompt_cache() -> str | None:
+    """
+    Return a cachedContents name holding EVAL_PROMPT, recreating it before it
+    expires. Returns None when Gemini will not cache the prompt, in which case
+    the prompt is sent inline and only implicit prefix caching applies.
+    While another thread refreshes, the current (possibly None) name is used.
+    """
+    with _prompt_cache_lock:
+        if _prompt_cache["refreshing"] or time.time() < _prompt_cache["expires"]:
+            return _prompt_cache["name"]
+        _prompt_cache["refreshing"] = True
+
+    # The network call runs outside the lock so evaluations never queue on it
+    name = None
+    try:
+        resp = NO_RETRY_SESSION.post(
+            CACHED_CONTENTS_URL,
+            data=orjson.dumps({
+                "model": f"models/{GEMINI_MODEL}",
+                "contents": [{"role": "user", "parts": [PROMPT_PART]}],
+                "ttl": f"{PROMPT_CACHE_TTL}s",
+            }),
+            headers=JSON_HEADERS,
+            timeout=PROMPT_CACHE_TIMEOUT,
+        )
+        if resp.status_code == 200:
+            name = orjson.loads(resp.content).get("name")
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+        pass
+    finally:
+        # Refresh a minute early; after a failure wait before asking again
+        with _prompt_cache_lock:
+            if name:
+                _prompt_cache["expires"] = time.time() + PROMPT_CACHE_TTL - 60
+            else:
+                _prompt_cache["expires"] = time.time() + PROMPT_CACHE_RETRY
+            _prompt_cache["name"] = name
+            _prompt_cache["refreshing"] = False
+
+    return name
+
+
+def reset_prompt_cache(name: str) -> None:
+    """
+    Forget a cachedContents name Gemini rejected so the next call recreates it.
+    """
+    with _prompt_cache_lock:
+        if _prompt_cache["name"] == name:
+            _prompt_cache["name"] = None
+            _prompt_cache["expires"] = 0.0
+
+
+def read_streamed_text(resp: requests.Response) -> str:
+    """
+    Collect answer text from a streamGenerateContent SSE response.
+    Raises as soon as a chunk reports a block or an abnormal finish.
+    """
+    fragments = []
+    for line in resp.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+
+        chunk = orjson.loads(line[5:])
+        block_reason = chunk.get("promptFeedback", {}).get("blockReason")
+        if block_reason:
+            raise RuntimeError(f"Gemini blocked the request: {block_reason}")
+
+        # Usage-only and other metadata events carry no candidates
+        candidates = chunk.get("candidates") or []
+        if not candidates:
+            continue
+
+        candidate = candidates[0]
+        for part in candidate.get("content", {}).get("parts", []):
+            if not part.get("thought"):
+                fragments.append(part.get("text", ""))
+
+        finish_reason = candidate.get("finishReason")
+        if finish_reason and finish_reason != "STOP":
+            raise RuntimeError(f"Gemini stopped early: {finish_reason}")
+
+    text = "".join(fragments)
+    if not text:
+        raise RuntimeError("Gemini returned no answer text")
+    return text
+
+
+def post_generate(video_part: dict, cache_name: str | None) -> requests.Response:
+    """
+    Start a streamGenerateContent call, referencing the prompt cache if given.
+    """
+    if cache_name:
+        payload = {
+            "cachedContent": cache_name,
+            "contents": [{"role": "user", "parts": [video_part]}],
+            "generationConfig": _GEN_CFG,
+        }
+    else:
+        payload = {
+            "contents": [{"role": "user", "parts": [PROMPT_PART, video_part]}],
+            "generationConfig": _GEN_CFG,
+        }
+
+    # Retries and backoff are handled by the session adapter
+    try:
+        return SESSION.post(
+            GENERATE_URL,
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
+            timeout=TIMEOUT,
+            stream=True,
+        )
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"Gemini API request failed after retries: {str(e)}")
+
+
+def generate_evaluation(file_uri: str, mime_type: str) -> dict:
+    """
+    Stream generateContent for an uploaded file and expect JSON text back.
+    """
+    video_part = {
+        "file_data": {
+            "mime_type": mime_type,
+            "file_uri": file_uri,
+        }
     }
 
-    # Retry logic for 503 errors
-    max_retries = 3
-    for attempt in range(max_retries):
+    cache_name = get_prompt_cache()
+    resp = post_generate(video_part, cache_name)
+
+    # A cache Gemini no longer accepts must not fail every evaluation until it
+    # would have expired; drop it and resend once with the prompt inline
+    if cache_name and 400 <= resp.status_code < 500 and resp.status_code != 429:
+        resp.close()
+        reset_prompt_cache(cache_name)
+        resp = post_generate(video_part, None)
+
+    with resp:
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Gemini API error {resp.status_code}: {resp.text[:300]}"
+            )
+
         try:
-            resp = requests.post(url, json=payload, timeout=300)
-            
-            # If we get a 503, retry after a delay
-            if resp.status_code == 503 and attempt < max_retries - 1:
-                time.sleep(5)
-                continue
-            
-            # If not 200, raise error
-            if resp.status_code != 200:
-                raise RuntimeError(
-                    f"Gemini API error {resp.status_code}: {resp.text[:300]}"
-                )
-            
-            # Success - break out of retry loop
-            break
-            
-        except requests.exceptions.Timeout:
-            if attempt < max_retries - 1:
-                time.sleep(5)
-                continue
-            raise RuntimeError("Gemini API request timed out after retries")
-
-    data = resp.json()
+            text = read_streamed_text(resp)
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Gemini response stream failed: {str(e)}")
+        except (orjson.JSONDecodeError, KeyError, IndexError) as e:
+            raise RuntimeError(f"Unexpected Gemini response format: {str(e)}")
+
+    # Parse once the stream has closed, validating against the schema
+    try:
+        parsed = msgspec.json.decode(text, type=EvalResult, strict=False)
+    except msgspec.ValidationError as e:
+        raise RuntimeError(f"Gemini JSON does not match the schema: {str(e)}")
+    except msgspec.DecodeError as e:
+        raise RuntimeError(f"Gemini did not return valid JSON: {str(e)}")
+
+    return msgspec.to_builtins(parsed)
+
+
+def hash_video(video_stream: BinaryIO) -> str:
+    """
+    BLAKE2b digest of the video, read in chunks and rewound afterwards.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: video_stream.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    video_stream.seek(0)
+    return digest.hexdigest()
+
+
+def stream_size(stream: BinaryIO) -> int:
+    """
+    Size of a seekable stream, leaving it rewound to the start.
+    """
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def video_height(video_stream: BinaryIO) -> int | None:
+    """
+    Height of the first video stream according to ffprobe, or None if unknown.
+    """
+    try:
+        probe = subprocess.run(
+            [
+                FFPROBE, "-v", "error", "-select_streams", "v:0",
+                "-show_entries", "stream=height", "-of", "csv=p=0", "/dev/stdin",
+            ],
+            stdin=video_stream,
+            capture_output=True,
+            timeout=30,
+            check=True,
+        )
+        return int(probe.stdout.split()[0])
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError) as e:
+        app.logger.warning("ffprobe failed: %s", e)
+        return None
+    finally:
+        video_stream.seek(0)
+
+
+def transcode_video(video_stream: BinaryIO, size: int) -> BinaryIO | None:
+    """
+    Downscale videos taller than 720p before upload.
+    Returns None, so the original is sent, when the video is already small
+    enough, ffmpeg is unavailable, busy or fails, or the result is not smaller.
+    """
+    if not FFMPEG or not FFPROBE:
+        return None
+
+    height = video_height(video_stream)
+    if height is None or height <= TRANSCODE_MAX_HEIGHT:
+        return None
+
+    # Send the original rather than queue the request behind other transcodes
+    if not TRANSCODE_SLOTS.acquire(blocking=False):
+        return None
+    try:
+        output = run_ffmpeg_transcode(video_stream)
+    finally:
+        TRANSCODE_SLOTS.release()
+
+    if output is not None and stream_size(output) >= size:
+        output.close()
+        video_stream.seek(0)
+        return None
+
+    return output
+
+
+def run_ffmpeg_transcode(video_stream: BinaryIO) -> BinaryIO | None:
+    """
+    Re-encode to 720p 24fps H.264 with ffmpeg, writing to a temp file.
+    Returns None when ffmpeg fails.
+    """
+    output = tempfile.TemporaryFile()
     try:
-        text = data["candidates"][0]["content"]["parts"][0]["text"]
+        # /dev/stdin keeps the spooled file seekable, unlike pipe:0, so MP4s
+        # with the moov atom at the end still demux
+        subprocess.run(
+            [
+                FFMPEG, "-loglevel", "error", "-i", "/dev/stdin",
+                "-vf", "scale=-2:'min(720,ih)'", "-r", "24",
+                "-c:v", "libx264", "-crf", "30", "-preset", "veryfast",
+                "-c:a", "aac", "-b:a", "64k",
+                "-f", "mp4", "-movflags", "frag_keyframe+empty_moov", "pipe:1",
+            ],
+            stdin=video_stream,
+            stdout=output,
+            stderr=subprocess.PIPE,
+            timeout=TRANSCODE_TIMEOUT,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        stderr = getattr(e, "stderr", None) or b""
+        app.logger.warning(
+            "ffmpeg transcode failed: %s %s",
+            e, stderr.decode("utf-8", "replace")[-500:],
+        )
+        output.close()
+        video_stream.seek(0)
+        return None
+
+    if not stream_size(output):
+        app.logger.warning("ffmpeg transcode produced no output")
+        output.close()
+        video_stream.seek(0)
+        return None
+
+    return output
+
+
+def disk_cache_get(key: str) -> dict | None:
+    """
+    Read a cached result from disk, treating any disk error as a miss.
+    """
+    try:
+        return DISK_CACHE.get(key)
     except Exception as e:
-        raise RuntimeError(f"Unexpected Gemini response format: {str(e)}")
+        app.logger.warning("Disk cache read failed: %s", e)
+        return None
+
 
+def disk_cache_set(key: str, result: dict) -> None:
+    """
+    Store a result on disk; a disk error must not fail the evaluation.
+    """
     try:
-        parsed = json.loads(text)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Gemini did not return valid JSON: {str(e)}")
+        DISK_CACHE.set(key, result, expire=EVAL_CACHE_TTL)
+    except Exception as e:
+        app.logger.warning("Disk cache write failed: %s", e)
+
+
+def call_gemini_with_video(video_stream: BinaryIO, size: int, mime_type: str) -> dict:
+    """
+    Upload video through the Files API and ask Gemini generateContent for JSON.
+    The uploaded file is deleted as soon as the evaluation finishes.
+    """
+    file_info = upload_video_to_gemini(video_stream, size, mime_type)
+    # Delete on every path once the upload exists, including failed processing
+    try:
+        file_info = wait_for_file_active(file_info)
+        return generate_evaluation(file_info["uri"], mime_type)
+    finally:
+        delete_gemini_file(file_info["name"])
+
+
+def warm_gemini_connection() -> None:
+    """
+    Open a pooled connection and the prompt cache before the first evaluation.
+    """
+    try:
+        SESSION.get(MODEL_URL, timeout=5)
+    except requests.exceptions.RequestException:
+        return
+    get_prompt_cache()
 
-    if not isinstance(parsed, dict):
-        raise RuntimeError("Gemini JSON root must be an object")
 
-    return parsed
+# Runs in every worker at import, off the boot path
+threading.Thread(target=warm_gemini_connection, daemon=True).start()
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def upload_too_large(e):
+    return jsonify({
+        "error": "video_too_large",
+        "message": f"video must be at most {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+    }), 413
 
 
 @app.route("/", methods=["GET"])
@@ -209,24 +692,52 @@ def health():
 
 @app.route("/evaluate", methods=["POST"])
 def evaluate_pitch():
+    if request.content_length and request.content_length > MAX_UPLOAD_BYTES:
+        raise RequestEntityTooLarge()
+
     try:
         if "video" not in request.files:
             return jsonify({"error": "missing 'video' file field"}), 400
 
         video_file = request.files["video"]
-        video_bytes = video_file.read()
+        video_stream = video_file.stream
 
-        if not video_bytes:
+        # Werkzeug spools the upload to a temp file, so size it without reading
+        size = stream_size(video_stream)
+        if not size:
             return jsonify({"error": "empty video payload"}), 400
 
-        mime_type = video_file.mimetype or "video/mp4"
+        key = f"{PROMPT_VERSION}:{hash_video(video_stream)}"
+        with _eval_cache_lock:
+            cached = EVAL_CACHE.get(key)
+        if cached is None:
+            cached = disk_cache_get(key)
+            if cached is not None:
+                with _eval_cache_lock:
+                    EVAL_CACHE[key] = cached
+        if cached is not None:
+            return jsonify(cached)
 
-        result = call_gemini_with_video(video_bytes, mime_type)
+        mime_type = video_file.mimetype or "video/mp4"
 
-        del video_bytes
+        transcoded = transcode_video(video_stream, size)
+        try:
+            if transcoded is not None:
+                video_stream, mime_type = transcoded, "video/mp4"
+                size = stream_size(transcoded)
+            result = call_gemini_with_video(video_stream, size, mime_type)
+        finally:
+            if transcoded is not None:
+                transcoded.close()
+
+        with _eval_cache_lock:
+            EVAL_CACHE[key] = result
+        disk_cache_set(key, result)
 
         return jsonify(result)
 
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         return jsonify({
             "error": "evaluation_failed",
@@ -235,5 +746,8 @@ def evaluate_pitch():
 
 
 if __name__ == "__main__":
+    app.logger.warning(
+        "Running the Flask development server; use `gunicorn app:app` in production"
+    )
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
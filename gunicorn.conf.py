@@ -0,0 +1,12 @@
+import os
+
+# Evaluations spend nearly all their time waiting on Gemini, so each worker
+# serves many requests from threads. Start with: gunicorn app:app
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 32))
+timeout = 600
+
+# Import the app in each worker so the HTTP session is created after fork
+preload_app = False